@@ -101,22 +101,27 @@ class VerticaPythonIntegrationTestCase(VerticaPythonTestCase):
 
     @classmethod
     def createPrepStmtClass(cls):
-        """Generates the code of a new subclass that has the same tests as this
-        class but turns on the server-side prepared statements. To ensure test
+        """Creates a new subclass that has the same tests as this class but
+        turns on the server-side prepared statements. To ensure test
         coverage, this method should be used if tests are not sensitive to
         paramstyles (or query protocols).
-        Usage: "exec(xxxTestCase.createPrepStmtClass())"
+        Usage: "PrepStmtXxxTestCase = XxxTestCase.createPrepStmtClass()"
 
-        :return: a string acceptable by exec() to define the class
+        :return: the new class, to be bound to a module-level name so that
+                 the test runner collects it
         """
-        base_cls_name = cls.__name__
-        cls_name = 'PrepStmt' + base_cls_name
-        code = ('class ' + cls_name + '(' + base_cls_name + '):\n'
-                '  @classmethod\n'
-                '  def setUpClass(cls):\n'
-                '    super(' + cls_name + ', cls).setUpClass()\n'
-                "    cls._conn_info['use_prepared_statements'] = True")
-        return code
+        # The subclass never changes for a given base class, so build it once
+        # and cache it on that class. Building it with type() avoids
+        # compiling and exec'ing generated source.
+        if '_prep_stmt_cls' not in cls.__dict__:
+            def setUpClass(kls):
+                super(prep_stmt_cls, kls).setUpClass()
+                kls._conn_info['use_prepared_statements'] = True
+
+            prep_stmt_cls = type('PrepStmt' + cls.__name__, (cls,),
+                                 {'setUpClass': classmethod(setUpClass)})
+            cls._prep_stmt_cls = prep_stmt_cls
+        return cls._prep_stmt_cls
 
     def _query_and_fetchall(self, query):
         """Creates a new connection, executes a query and fetches all the results.
@@ -177,8 +182,14 @@ class VerticaPythonIntegrationTestCase(VerticaPythonTestCase):
             self.skipTest(msg)
 
     def require_protocol_at_least(self, min_protocol_version):
-        with self._connect() as conn:
-            effective_protocol = conn.parameters['protocol_version']
+        # The negotiated protocol version does not change between tests, so
+        # probe the server once per test class and cache the result
+        cls = type(self)
+        effective_protocol = cls.__dict__.get('_effective_protocol')
+        if effective_protocol is None:
+            with self._connect() as conn:
+                effective_protocol = conn.parameters['protocol_version']
+            cls._effective_protocol = effective_protocol
         if effective_protocol < min_protocol_version:
             msg = ("The test requires the effective protocol version to be at "
                    "least {}.{}, but the current version is {}.{}.").format(
@@ -108,4 +108,4 @@ class AuthenticationTestCase(VerticaPythonIntegrationTestCase):
                 cur.execute("DROP AUTHENTICATION IF EXISTS testlocalHash CASCADE")
 
 
-exec(AuthenticationTestCase.createPrepStmtClass())
+PrepStmtAuthenticationTestCase = AuthenticationTestCase.createPrepStmtClass()
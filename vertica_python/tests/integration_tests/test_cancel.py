@@ -100,4 +100,4 @@ class CancelTestCase(VerticaPythonIntegrationTestCase):
                 cur.execute("DROP TABLE IF EXISTS vptest")
 
 
-exec(CancelTestCase.createPrepStmtClass())
+PrepStmtCancelTestCase = CancelTestCase.createPrepStmtClass()
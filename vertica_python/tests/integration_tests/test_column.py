@@ -100,4 +100,4 @@ class ColumnTestCase(VerticaPythonIntegrationTestCase):
             cur.execute("DROP TABLE IF EXISTS full_type_tbl")
 
 
-exec(ColumnTestCase.createPrepStmtClass())
+PrepStmtColumnTestCase = ColumnTestCase.createPrepStmtClass()
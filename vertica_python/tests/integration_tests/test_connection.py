@@ -107,4 +107,4 @@ class ConnectionTestCase(VerticaPythonIntegrationTestCase):
             conn.autocommit = True
             self.assertTrue(conn.autocommit)
 
-exec(ConnectionTestCase.createPrepStmtClass())
+PrepStmtConnectionTestCase = ConnectionTestCase.createPrepStmtClass()
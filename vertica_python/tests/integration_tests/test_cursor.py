@@ -488,7 +488,7 @@ class CursorTestCase(VerticaPythonIntegrationTestCase):
             else:
                 self.assertListOfListsEqual(res, [[b'1', b'aa'], [b'2', b'bb']])
 
-exec(CursorTestCase.createPrepStmtClass())
+PrepStmtCursorTestCase = CursorTestCase.createPrepStmtClass()
 
 
 class SimpleQueryTestCase(VerticaPythonIntegrationTestCase):
@@ -35,6 +35,12 @@
 
 from __future__ import print_function, division, absolute_import
 
+import functools
+
+# These imports stay eager on purpose: the module-level case tables and the
+# class-level expected-value constants below evaluate these names while the
+# module is imported, so deferring them (e.g. behind a PEP 562 module
+# __getattr__) would just move the same import cost, not remove it.
 from datetime import date, datetime, time
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzoffset
@@ -44,6 +50,12 @@ from uuid import UUID
 
 from .base import VerticaPythonIntegrationTestCase
 
+# The interval tests below build the same relativedelta expected values over
+# and over (once more for each prep-stmt mirror test), and relativedelta's
+# argument normalization is not cheap. Memoize the constructor so identical
+# expected values are built once and shared.
+_RD = functools.lru_cache(maxsize=None)(relativedelta)
+
 
 class TypeTestCase(VerticaPythonIntegrationTestCase):
     def test_decimal_query(self):
@@ -72,227 +84,250 @@ class TypeTestCase(VerticaPythonIntegrationTestCase):
         self.assertEqual(res[0], value)
 
 
-exec(TypeTestCase.createPrepStmtClass())
+PrepStmtTypeTestCase = TypeTestCase.createPrepStmtClass()
+
+# Case tables for InsertComplexTypeTestCase, built once at import so the
+# fixture values are not reconstructed on every test invocation.
+# Each case is (column type, inserted values, expected results);
+# expected is None when the values are read back unchanged
+_ARRAY_CASES = (
+    ('ARRAY[BOOL]', [[True, False, None], None, [], [None]], None),
+    ('ARRAY[INT]', [[1,-2,3], [4,None,5], None, [], [None]], None),
+    ('ARRAY[ARRAY[INT]]', [[[1,2], [3,4], None, [5,None], []],
+        None, [], [None]], None),
+    ('ARRAY[ARRAY[ARRAY[ARRAY[INT]]]]', [[[[None,[1,2,3],None,[1,None,3],[None,None,None],[4,5],[],None]]],
+        None, [], [None]], None),
+    ('ARRAY[FLOAT]', [[1.23456e-18,float('Inf'),float('-Inf'),None,-1.234,0.0], None, [], [None]], None),
+    ('ARRAY[NUMERIC]', [[Decimal('-1.1200000000'), Decimal('0E-10'), None, Decimal('1234567890123456789.0123456789')],
+        None, [], [None]], None),
+    ('ARRAY[CHAR(3)]', [['a', u'\u16b1', None, 'foo'], None, [], [None]], [['a  ', u'\u16b1', None, 'foo'], None, [], [None]]),
+    ('ARRAY[VARCHAR(10)]', [['', u'\u16b1\nb', None, 'foo'], None, [], [None]], None),
+    ('ARRAY[DATE]', [[date(2021, 6, 10),None,date(221, 5, 2)], None, [], [None]], None),
+    ('ARRAY[TIME(3)]', [[time(0, 0, 0),None,time(22, 36, 33, 124000)], None, [], [None]], None),
+    ('ARRAY[TIMETZ(3)]', [[time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)),None,
+        time(22, 36, 33, 123000, tzinfo=tzoffset(None, -10800))], None, [], [None]], None),
+    ('ARRAY[TIMESTAMP]', [[datetime(276, 12, 1, 11, 22, 33),None,datetime(2001, 12, 1, 0, 30, 45, 87000)], None, [], [None]], None),
+    ('ARRAY[TIMESTAMPTZ]', [[datetime(276, 11, 30, 23, 32, 57, tzinfo=tzoffset(None, 3600)),None,datetime(2001, 12, 1, 0, 30, 45, 87000, tzinfo=tzoffset(None, -18000))], None, [], [None]], None),
+    ('ARRAY[UUID]', [[UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'),None,UUID('123e4567-e89b-12d3-a456-426655440a00')], None, [], [None]], None),
+)
+
+_SET_CASES = (
+    ('SET[BOOL]', [{True, False, None}, None, set(), {None}], None),
+    ('SET[INT]', [{0, 1, -2, 3, None}, None, set(), {None}], None),
+    ('SET[FLOAT]', [{float('Inf'), float('-Inf'), None, -1.234, 0.0, 1.23456e-18}, None, set(), {None}], None),
+    ('SET[NUMERIC]', [{Decimal('-1.12'), Decimal('0E-15'), None, Decimal('1234567890123456789.0123456789')},
+        None, set(), {None}], None),
+    ('SET[CHAR(3)]', [{'a  ', u'\u16b1', None, 'foo'}, None, set(), {None}], None),
+    ('SET[VARCHAR(10)]', [{'', u'\u16b1\nb', None, 'foo'}, None, set(), {None}], None),
+    ('SET[DATE]', [{date(2021, 6, 10), None, date(221, 5, 2)}, None, set(), {None}], None),
+    ('SET[TIME(3)]', [{time(0, 0, 0), None, time(22, 36, 33, 124000)}, None, set(), {None}], None),
+    ('SET[TIMETZ(3)]', [{time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)),None,
+        time(22, 36, 33, 123000, tzinfo=tzoffset(None, -10800))}, None, set(), {None}], None),
+    ('SET[TIMESTAMP]', [{datetime(276, 12, 1, 11, 22, 33),None,datetime(2001, 12, 1, 0, 30, 45, 87000)}, None, set(), {None}], None),
+    ('SET[TIMESTAMPTZ]', [{datetime(276, 11, 30, 23, 32, 57, tzinfo=tzoffset(None, 3600)),None,
+        datetime(2001, 12, 1, 0, 30, 45, 87000, tzinfo=tzoffset(None, -18000))}, None, set(), {None}], None),
+    ('SET[UUID]', [{UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'),None,UUID('123e4567-e89b-12d3-a456-426655440a00')}, None, set(), {None}], None),
+)
+
+_ROW_CASES = (
+    ('ROW(BOOL, ARRAY[BOOL], ROW(BOOL, ARRAY[BOOL]))', [
+            {'f0': True, 'f1': [None, False], 'f2': {'f0': False, 'f1': [True, None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(INT, ARRAY[INT], ROW(INT, ARRAY[INT]))', [
+            {'f0': -10, 'f1': [None, 1, 2], 'f2': {'f0': 90, 'f1': [0, None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+            {'f0': 5, 'f1': [], 'f2': None},
+        ], None),
+    ('ROW(FLOAT, ARRAY[FLOAT], ROW(FLOAT, ARRAY[FLOAT]))', [
+            {'f0': 0.0, 'f1': [None, 1.23456e-18], 'f2': {'f0': float('-Inf'), 'f1': [-1.2, None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(NUMERIC, ARRAY[NUMERIC], ROW(NUMERIC, ARRAY[NUMERIC]))', [
+            {'f0': Decimal('-1.12'), 'f1': [None, Decimal('0E-15')], 'f2': {'f0': Decimal('1234567890123456789.0123456789'), 'f1': [Decimal(10), None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(CHAR(3), ARRAY[CHAR(3)], ROW(CHAR(3), ARRAY[CHAR(3)]))', [
+            {'f0': 'a  ', 'f1': [None, 'foo'], 'f2': {'f0': '\u16b1', 'f1': [' b ', None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(VARCHAR, ARRAY[VARCHAR], ROW(VARCHAR, ARRAY[VARCHAR]))', [
+            {'f0': 'a', 'f1': [None, 'foo'], 'f2': {'f0': '\u16b1\nb', 'f1': ['', None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(DATE, ARRAY[DATE], ROW(DATE, ARRAY[DATE]))', [
+            {'f0': date(2021, 6, 10), 'f1': [None, date(2021, 6, 11)], 'f2': {'f0': date(221, 5, 2), 'f1': [date(2023, 1, 1), None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(TIME(3), ARRAY[TIME(3)], ROW(TIME(3), ARRAY[TIME(3)]))', [
+            {'f0': time(0, 0, 0), 'f1': [None, time(8, 30, 10)], 'f2': {'f0': time(22, 36, 33, 124000), 'f1': [time(0, 0, 0, 500000), None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(TIMETZ(3), ARRAY[TIMETZ], ROW(TIMETZ, ARRAY[TIMETZ(3)]))', [
+            {'f0': time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)), 'f1': [None, time(8, 30, 10, tzinfo=tzoffset(None, -23400))],
+             'f2': {'f0': time(22, 36, 33, 123000, tzinfo=tzoffset(None, -10800)), 'f1': [time(0, 0, tzinfo=tzoffset(None, 10800)), None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(TIMESTAMP, ARRAY[TIMESTAMP], ROW(TIMESTAMP, ARRAY[TIMESTAMP]))', [
+            {'f0': datetime(276, 12, 1, 11, 22, 33), 'f1': [None, datetime(2001, 12, 1, 0, 30, 45, 87000)],
+             'f2': {'f0': datetime(2023, 12, 1, 11, 30, 45, 87000), 'f1': [datetime(1998, 12, 1, 11, 22, 33), None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(TIMESTAMPTZ, ARRAY[TIMESTAMPTZ], ROW(TIMESTAMPTZ, ARRAY[TIMESTAMPTZ]))', [
+            {'f0': datetime(276, 11, 30, 23, 32, 57, tzinfo=tzoffset(None, 23400)),
+             'f1': [None, datetime(2001, 12, 1, 0, 30, 45, 87000, tzinfo=tzoffset(None, -18000))],
+             'f2': {'f0':  datetime(2011, 12, 1, 0, 30, 45, 57000, tzinfo=tzoffset(None, 18000)),
+                    'f1': [datetime(2023, 12, 1, 11, 30, 45, tzinfo=tzoffset(None, -23400)), None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+    ('ROW(UUID, ARRAY[UUID], ROW(UUID, ARRAY[UUID]))', [
+            {'f0': UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'), 'f1': [None, UUID('123e4567-e89b-12d3-a456-426655440a00')],
+             'f2': {'f0': UUID('123e4567-e89b-12d3-a456-426655440a00'), 'f1': [UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'), None]}},
+            {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
+        ], None),
+)
+
 
 class InsertComplexTypeTestCase(VerticaPythonIntegrationTestCase):
     """
     Python objects (list, set, dict) convert to SQL literal (ARRAY, SET, ROW)
     Only for client-side bindings (use_prepared_statements=False)
     """
+    _table = 'insert_complex_types_test'
+    _table_col_type = None  # column type of the currently created test table
+    _insert_sql_cache = {}  # (col_type, number of rows) -> INSERT statement
+
+    @classmethod
+    def setUpClass(cls):
+        super(InsertComplexTypeTestCase, cls).setUpClass()
+        # All tests in this class share one connection instead of paying a
+        # handshake per test
+        cls._conn = cls._connect()
+        cls._cur = cls._conn.cursor()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._cur.execute(f"DROP TABLE IF EXISTS {cls._table}")
+        cls._conn.close()
+        super(InsertComplexTypeTestCase, cls).tearDownClass()
+
     def setUp(self):
         super(InsertComplexTypeTestCase, self).setUp()
         self.require_protocol_at_least(3 << 16 | 12)
-        self._table = 'insert_complex_types_test'
-
-    def tearDown(self):
-        with self._connect() as conn:
-            cur = conn.cursor()
-            cur.execute(f"DROP TABLE IF EXISTS {self._table}")
-        super(InsertComplexTypeTestCase, self).tearDown()
 
     def _test_insert_complex_type(self, col_type, values, expected=None):
         if expected is None:
             expected = values
-        with self._connect() as conn:
-            cur = conn.cursor()
+        cur = self._cur
+        # DDL is expensive (catalog lock), so the table is recreated only
+        # when the column type changes and emptied with TRUNCATE otherwise
+        if type(self)._table_col_type == col_type:
+            cur.execute(f"TRUNCATE TABLE {self._table}")
+        else:
             cur.execute(f"DROP TABLE IF EXISTS {self._table}")
             cur.execute(f"CREATE TABLE {self._table} (a INT, b {col_type})")
-            a = 1
-            for value in values:
-                # Some cases need explicit typecasting
-                cur.execute(f"INSERT INTO {self._table} (a, b) VALUES (%s, %s::{col_type})", [a, value], use_prepared_statements=False)
-                a += 1
-            rows = cur.execute(f"SELECT b FROM {self._table} ORDER BY a").fetchall()
-            results = [row[0] for row in rows]
-            self.assertEqual(results, expected)
+            type(self)._table_col_type = col_type
+        # Load all rows with a single multi-row INSERT so that the whole
+        # test pays one round trip instead of one per value.
+        # Note: cursor.copy()/executemany() would bulk-load in one round trip
+        # as well (executemany rewrites INSERT into COPY FROM STDIN), but the
+        # delimited COPY format cannot carry ARRAY/SET/ROW literals and this
+        # class exists to exercise the client-side literal binder, so the
+        # batch has to stay a literal INSERT.
+        parameters = []
+        for a, value in enumerate(values, 1):
+            parameters.extend([a, value])
+        # The statement text is constant per (col_type, row count), so build
+        # it once and reuse it across invocations and mirror classes
+        insert_sql = self._insert_sql_cache.get((col_type, len(values)))
+        if insert_sql is None:
+            # Some cases need explicit typecasting
+            sql_values = ", ".join([f"(%s, %s::{col_type})"] * len(values))
+            insert_sql = f"INSERT INTO {self._table} (a, b) VALUES {sql_values}"
+            self._insert_sql_cache[(col_type, len(values))] = insert_sql
+        cur.execute(insert_sql, parameters, use_prepared_statements=False)
+        # Read back unordered and sort on the dense key client-side, saving
+        # the server a sort operator for these tiny result sets
+        rows = cur.execute(f"SELECT a, b FROM {self._table}").fetchall()
+        results = [row[1] for row in sorted(rows, key=lambda row: row[0])]
+        self.assertEqual(results, expected)
 
     #######################
     # tests for ARRAY type
     #######################
-    def test_Array_boolean_type(self):
-        self._test_insert_complex_type('ARRAY[BOOL]', [[True, False, None], None, [], [None]])
-
-    def test_Array_integer_type(self):
-        self._test_insert_complex_type('ARRAY[INT]', [[1,-2,3], [4,None,5], None, [], [None]])
-        self._test_insert_complex_type('ARRAY[ARRAY[INT]]', [[[1,2], [3,4], None, [5,None], []],
-            None, [], [None]])
-        self._test_insert_complex_type('ARRAY[ARRAY[ARRAY[ARRAY[INT]]]]', [[[[None,[1,2,3],None,[1,None,3],[None,None,None],[4,5],[],None]]],
-            None, [], [None]])
-
-    def test_Array_float_type(self):
-        self._test_insert_complex_type('ARRAY[FLOAT]', [[1.23456e-18,float('Inf'),float('-Inf'),None,-1.234,0.0], None, [], [None]])
-
-    def test_Array_numeric_type(self):
-        self._test_insert_complex_type('ARRAY[NUMERIC]', [[Decimal('-1.1200000000'), Decimal('0E-10'), None, Decimal('1234567890123456789.0123456789')],
-            None, [], [None]])
-
-    def test_Array_char_type(self):
-        self._test_insert_complex_type('ARRAY[CHAR(3)]', [['a', u'\u16b1', None, 'foo'], None, [], [None]], [['a  ', u'\u16b1', None, 'foo'], None, [], [None]])
-
-    def test_Array_varchar_type(self):
-        self._test_insert_complex_type('ARRAY[VARCHAR(10)]', [['', u'\u16b1\nb', None, 'foo'], None, [], [None]])
-
-    def test_Array_date_type(self):
-        self._test_insert_complex_type('ARRAY[DATE]', [[date(2021, 6, 10),None,date(221, 5, 2)], None, [], [None]])
+    # Each case is (column type, inserted values, expected results);
+    # expected is None when the values are read back unchanged
 
-    def test_Array_time_type(self):
-        self._test_insert_complex_type('ARRAY[TIME(3)]', [[time(0, 0, 0),None,time(22, 36, 33, 124000)], None, [], [None]])
-
-    def test_Array_timetz_type(self):
-        self._test_insert_complex_type('ARRAY[TIMETZ(3)]', [[time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)),None,
-            time(22, 36, 33, 123000, tzinfo=tzoffset(None, -10800))], None, [], [None]])
-
-    def test_Array_timestamp_type(self):
-        self._test_insert_complex_type('ARRAY[TIMESTAMP]', [[datetime(276, 12, 1, 11, 22, 33),None,datetime(2001, 12, 1, 0, 30, 45, 87000)], None, [], [None]])
-
-    def test_Array_timestamptz_type(self):
-        self._test_insert_complex_type('ARRAY[TIMESTAMPTZ]', [[datetime(276, 11, 30, 23, 32, 57, tzinfo=tzoffset(None, 3600)),None,datetime(2001, 12, 1, 0, 30, 45, 87000, tzinfo=tzoffset(None, -18000))], None, [], [None]])
-
-    def test_Array_UUID_type(self):
-        self._test_insert_complex_type('ARRAY[UUID]', [[UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'),None,UUID('123e4567-e89b-12d3-a456-426655440a00')], None, [], [None]])
+    def test_Array_types(self):
+        for col_type, values, expected in _ARRAY_CASES:
+            with self.subTest(col_type=col_type):
+                self._test_insert_complex_type(col_type, values, expected)
 
     #####################
     # tests for SET type
     #####################
-    def test_1DSet_boolean_type(self):
-        self._test_insert_complex_type('SET[BOOL]', [{True, False, None}, None, set(), {None}])
-
-    def test_1DSet_integer_type(self):
-        self._test_insert_complex_type('SET[INT]', [{0, 1, -2, 3, None}, None, set(), {None}])
-
-    def test_1DSet_float_type(self):
-        self._test_insert_complex_type('SET[FLOAT]', [{float('Inf'), float('-Inf'), None, -1.234, 0.0, 1.23456e-18}, None, set(), {None}])
-
-    def test_1DSet_numeric_type(self):
-        self._test_insert_complex_type('SET[NUMERIC]', [{Decimal('-1.12'), Decimal('0E-15'), None, Decimal('1234567890123456789.0123456789')},
-            None, set(), {None}])
-
-    def test_1DSet_char_type(self):
-        self._test_insert_complex_type('SET[CHAR(3)]', [{'a  ', u'\u16b1', None, 'foo'}, None, set(), {None}])
-
-    def test_1DSet_varchar_type(self):
-        self._test_insert_complex_type('SET[VARCHAR(10)]', [{'', u'\u16b1\nb', None, 'foo'}, None, set(), {None}])
-
-    def test_1DSet_date_type(self):
-        self._test_insert_complex_type('SET[DATE]', [{date(2021, 6, 10), None, date(221, 5, 2)}, None, set(), {None}])
-
-    def test_1DSet_time_type(self):
-        self._test_insert_complex_type('SET[TIME(3)]', [{time(0, 0, 0), None, time(22, 36, 33, 124000)}, None, set(), {None}])
-
-    def test_1DSet_timetz_type(self):
-        self._test_insert_complex_type('SET[TIMETZ(3)]', [{time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)),None,
-            time(22, 36, 33, 123000, tzinfo=tzoffset(None, -10800))}, None, set(), {None}])
-
-    def test_1DSet_timestamp_type(self):
-        self._test_insert_complex_type('SET[TIMESTAMP]', [{datetime(276, 12, 1, 11, 22, 33),None,datetime(2001, 12, 1, 0, 30, 45, 87000)}, None, set(), {None}])
-
-    def test_1DSet_timestamptz_type(self):
-        self._test_insert_complex_type('SET[TIMESTAMPTZ]', [{datetime(276, 11, 30, 23, 32, 57, tzinfo=tzoffset(None, 3600)),None,
-            datetime(2001, 12, 1, 0, 30, 45, 87000, tzinfo=tzoffset(None, -18000))}, None, set(), {None}])
 
-    def test_1DSet_UUID_type(self):
-        self._test_insert_complex_type('SET[UUID]', [{UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'),None,UUID('123e4567-e89b-12d3-a456-426655440a00')}, None, set(), {None}])
+    def test_1DSet_types(self):
+        for col_type, values, expected in _SET_CASES:
+            with self.subTest(col_type=col_type):
+                self._test_insert_complex_type(col_type, values, expected)
 
     #####################
     # tests for ROW type
     #####################
-    def test_row_boolean_type(self):
-        self._test_insert_complex_type('ROW(BOOL, ARRAY[BOOL], ROW(BOOL, ARRAY[BOOL]))', [
-                {'f0': True, 'f1': [None, False], 'f2': {'f0': False, 'f1': [True, None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_integer_type(self):
-        self._test_insert_complex_type('ROW(INT, ARRAY[INT], ROW(INT, ARRAY[INT]))', [
-                {'f0': -10, 'f1': [None, 1, 2], 'f2': {'f0': 90, 'f1': [0, None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-                {'f0': 5, 'f1': [], 'f2': None},
-            ])
-
-    def test_row_float_type(self):
-        self._test_insert_complex_type('ROW(FLOAT, ARRAY[FLOAT], ROW(FLOAT, ARRAY[FLOAT]))', [
-                {'f0': 0.0, 'f1': [None, 1.23456e-18], 'f2': {'f0': float('-Inf'), 'f1': [-1.2, None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_numeric_type(self):
-        self._test_insert_complex_type('ROW(NUMERIC, ARRAY[NUMERIC], ROW(NUMERIC, ARRAY[NUMERIC]))', [
-                {'f0': Decimal('-1.12'), 'f1': [None, Decimal('0E-15')], 'f2': {'f0': Decimal('1234567890123456789.0123456789'), 'f1': [Decimal(10), None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_char_type(self):
-        self._test_insert_complex_type('ROW(CHAR(3), ARRAY[CHAR(3)], ROW(CHAR(3), ARRAY[CHAR(3)]))', [
-                {'f0': 'a  ', 'f1': [None, 'foo'], 'f2': {'f0': '\u16b1', 'f1': [' b ', None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_varchar_type(self):
-        self._test_insert_complex_type('ROW(VARCHAR, ARRAY[VARCHAR], ROW(VARCHAR, ARRAY[VARCHAR]))', [
-                {'f0': 'a', 'f1': [None, 'foo'], 'f2': {'f0': '\u16b1\nb', 'f1': ['', None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_date_type(self):
-        self._test_insert_complex_type('ROW(DATE, ARRAY[DATE], ROW(DATE, ARRAY[DATE]))', [
-                {'f0': date(2021, 6, 10), 'f1': [None, date(2021, 6, 11)], 'f2': {'f0': date(221, 5, 2), 'f1': [date(2023, 1, 1), None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_time_type(self):
-        self._test_insert_complex_type('ROW(TIME(3), ARRAY[TIME(3)], ROW(TIME(3), ARRAY[TIME(3)]))', [
-                {'f0': time(0, 0, 0), 'f1': [None, time(8, 30, 10)], 'f2': {'f0': time(22, 36, 33, 124000), 'f1': [time(0, 0, 0, 500000), None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_timetz_type(self):
-        self._test_insert_complex_type('ROW(TIMETZ(3), ARRAY[TIMETZ], ROW(TIMETZ, ARRAY[TIMETZ(3)]))', [
-                {'f0': time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)), 'f1': [None, time(8, 30, 10, tzinfo=tzoffset(None, -23400))],
-                 'f2': {'f0': time(22, 36, 33, 123000, tzinfo=tzoffset(None, -10800)), 'f1': [time(0, 0, tzinfo=tzoffset(None, 10800)), None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_timestamp_type(self):
-        self._test_insert_complex_type('ROW(TIMESTAMP, ARRAY[TIMESTAMP], ROW(TIMESTAMP, ARRAY[TIMESTAMP]))', [
-                {'f0': datetime(276, 12, 1, 11, 22, 33), 'f1': [None, datetime(2001, 12, 1, 0, 30, 45, 87000)],
-                 'f2': {'f0': datetime(2023, 12, 1, 11, 30, 45, 87000), 'f1': [datetime(1998, 12, 1, 11, 22, 33), None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_timestamptz_type(self):
-        self._test_insert_complex_type('ROW(TIMESTAMPTZ, ARRAY[TIMESTAMPTZ], ROW(TIMESTAMPTZ, ARRAY[TIMESTAMPTZ]))', [
-                {'f0': datetime(276, 11, 30, 23, 32, 57, tzinfo=tzoffset(None, 23400)),
-                 'f1': [None, datetime(2001, 12, 1, 0, 30, 45, 87000, tzinfo=tzoffset(None, -18000))],
-                 'f2': {'f0':  datetime(2011, 12, 1, 0, 30, 45, 57000, tzinfo=tzoffset(None, 18000)),
-                        'f1': [datetime(2023, 12, 1, 11, 30, 45, tzinfo=tzoffset(None, -23400)), None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
-
-    def test_row_UUID_type(self):
-        self._test_insert_complex_type('ROW(UUID, ARRAY[UUID], ROW(UUID, ARRAY[UUID]))', [
-                {'f0': UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'), 'f1': [None, UUID('123e4567-e89b-12d3-a456-426655440a00')],
-                 'f2': {'f0': UUID('123e4567-e89b-12d3-a456-426655440a00'), 'f1': [UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'), None]}},
-                {'f0': None, 'f1': [None], 'f2': {'f0': None, 'f1': []}},
-            ])
+
+    def test_row_types(self):
+        for col_type, values, expected in _ROW_CASES:
+            with self.subTest(col_type=col_type):
+                self._test_insert_complex_type(col_type, values, expected)
 
 
 class ComplexTypeTestCase(VerticaPythonIntegrationTestCase):
     """
     SQL data types (ARRAY, SET, ROW) convert to Python objects (list, set, dict)
     """
+    @classmethod
+    def tearDownClass(cls):
+        if '_shared_conn' in cls.__dict__:
+            cls._shared_conn.close()
+        super(ComplexTypeTestCase, cls).tearDownClass()
+
+    @classmethod
+    def _shared_cursor(cls):
+        """Returns a cursor on the class-wide connection, connecting lazily
+        so that subclasses (e.g. the prep-stmt mirror class) connect with
+        their own options."""
+        if '_shared_conn' not in cls.__dict__:
+            cls._shared_conn = cls._connect()
+            cls._shared_cur = cls._shared_conn.cursor()
+        return cls._shared_cur
+
     def setUp(self):
         super(ComplexTypeTestCase, self).setUp()
         self.require_protocol_at_least(3 << 16 | 12)
 
+    def _query_and_fetchone(self, query):
+        # Unlike the base class version, reuse the class-wide connection so
+        # that each test does not pay its own handshake
+        cur = self._shared_cursor()
+        cur.execute(query)
+        return cur.fetchone()
+
     ######################################################
     # tests for connection option 'request_complex_types'
     ######################################################
     def test_connection_option(self):
+        # This test needs its own connection: the option must be turned off
+        # before connecting, and the shared session keeps it on
         self._conn_info['request_complex_types'] = False
-        with self._connect() as conn:
-            cur = conn.cursor()
-            res = self._query_and_fetchone("SELECT ARRAY[-500, 0, null, 500]::ARRAY[INT]")
-            self.assertEqual(res[0], '[-500,0,null,500]')
+        try:
+            with self._connect() as conn:
+                cur = conn.cursor()
+                cur.execute("SELECT ARRAY[-500, 0, null, 500]::ARRAY[INT]")
+                res = cur.fetchone()
+                self.assertEqual(res[0], '[-500,0,null,500]')
+        finally:
+            del self._conn_info['request_complex_types']
 
     #######################
     # tests for ARRAY type
@@ -358,7 +393,7 @@ class ComplexTypeTestCase(VerticaPythonIntegrationTestCase):
     def test_1DArray_timetz_type(self):
         query = "SELECT ARRAY['22:36:33.12345+0630', null, '800-02-03 22:36:33.123456 America/Cayman']::ARRAY[TIMETZ(3)], ARRAY[]::ARRAY[TIMETZ(4)], null::ARRAY[TIMETZ]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)), None, 
+        self.assertEqual(res[0], [time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)), None,
                                   time(22, 36, 33, 123000, tzinfo=tzoffset(None, -19176))])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
@@ -373,10 +408,12 @@ class ComplexTypeTestCase(VerticaPythonIntegrationTestCase):
     def test_1DArray_timestamptz_type(self):
         with self._connect() as conn:
             cur = conn.cursor()
-            cur.execute("SET TIMEZONE 'America/Cayman'") # set session's time zone
-            cur.fetchall()
-            query = "SELECT ARRAY['276-12-1 11:22:33+0630', '2001-12-01 00:30:45.087 America/Cayman', null]::ARRAY[TIMESTAMPTZ], ARRAY[]::ARRAY[TIMESTAMPTZ(4)], null::ARRAY[TIMESTAMPTZ]"
-            cur.execute(query)
+            # Set the session's time zone and run the query in one round trip
+            query = "SET TIMEZONE 'America/Cayman'; SELECT ARRAY['276-12-1 11:22:33+0630', '2001-12-01 00:30:45.087 America/Cayman', null]::ARRAY[TIMESTAMPTZ], ARRAY[]::ARRAY[TIMESTAMPTZ(4)], null::ARRAY[TIMESTAMPTZ]"
+            # A prepared statement cannot hold multiple commands, so force
+            # the simple-query protocol for this compound statement
+            cur.execute(query, use_prepared_statements=False)
+            self.assertTrue(cur.nextset())  # advance past SET TIMEZONE
             res = cur.fetchone()
             self.assertEqual(res[0], [datetime(276, 11, 30, 23, 32, 57, tzinfo=tzoffset(None, -19176)),
                                 datetime(2001, 12, 1, 0, 30, 45, 87000, tzinfo=tzoffset(None, -18000)), None])
@@ -386,86 +423,86 @@ class ComplexTypeTestCase(VerticaPythonIntegrationTestCase):
     def test_1DArray_interval_type(self):
         query = "SELECT ARRAY['1 02:03:04.0005', '1 02:03:04', '02:03:04.0005', '02:03', null]::ARRAY[INTERVAL DAY TO SECOND], ARRAY[]::ARRAY[INTERVAL DAY TO SECOND], null::ARRAY[INTERVAL DAY TO SECOND]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(days=+1, hours=+2, minutes=+3, seconds=+4, microseconds=+500),
-                relativedelta(days=+1, hours=+2, minutes=+3, seconds=+4),
-                relativedelta(hours=+2, minutes=+3, seconds=+4, microseconds=+500),
-                relativedelta(hours=+2, minutes=+3), None])
+        self.assertEqual(res[0], [_RD(days=+1, hours=+2, minutes=+3, seconds=+4, microseconds=+500),
+                _RD(days=+1, hours=+2, minutes=+3, seconds=+4),
+                _RD(hours=+2, minutes=+3, seconds=+4, microseconds=+500),
+                _RD(hours=+2, minutes=+3), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['1 02:03', '02:03', null]::ARRAY[INTERVAL DAY TO MINUTE], ARRAY[]::ARRAY[INTERVAL DAY TO MINUTE], null::ARRAY[INTERVAL DAY TO MINUTE]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(days=+1, hours=+2, minutes=+3), relativedelta(hours=+2, minutes=+3), None])
+        self.assertEqual(res[0], [_RD(days=+1, hours=+2, minutes=+3), _RD(hours=+2, minutes=+3), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['1 02:03', '6', '02:03', null]::ARRAY[INTERVAL DAY TO HOUR], ARRAY[]::ARRAY[INTERVAL DAY TO HOUR], null::ARRAY[INTERVAL DAY TO HOUR]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(days=+1, hours=+2), relativedelta(days=+6), relativedelta(hours=+2), None])
+        self.assertEqual(res[0], [_RD(days=+1, hours=+2), _RD(days=+6), _RD(hours=+2), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['123', '-6', null]::ARRAY[INTERVAL DAY], ARRAY[]::ARRAY[INTERVAL DAY], null::ARRAY[INTERVAL DAY]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(days=+123), relativedelta(days=-6), None])
+        self.assertEqual(res[0], [_RD(days=+123), _RD(days=-6), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['02:03:04', '02:03:04.0005', '02:03', null]::ARRAY[INTERVAL HOUR TO SECOND], ARRAY[]::ARRAY[INTERVAL HOUR TO SECOND], null::ARRAY[INTERVAL HOUR TO SECOND]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(hours=+2, minutes=+3, seconds=+4),
-                relativedelta(hours=+2, minutes=+3, seconds=+4, microseconds=+500),
-                relativedelta(hours=+2, minutes=+3), None])
+        self.assertEqual(res[0], [_RD(hours=+2, minutes=+3, seconds=+4),
+                _RD(hours=+2, minutes=+3, seconds=+4, microseconds=+500),
+                _RD(hours=+2, minutes=+3), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['02:03:04', '-02:03', null]::ARRAY[INTERVAL HOUR TO MINUTE], ARRAY[]::ARRAY[INTERVAL HOUR TO MINUTE], null::ARRAY[INTERVAL HOUR TO MINUTE]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(hours=+2, minutes=+3), relativedelta(hours=-2, minutes=-3), None])
+        self.assertEqual(res[0], [_RD(hours=+2, minutes=+3), _RD(hours=-2, minutes=-3), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['32', '-03', null]::ARRAY[INTERVAL HOUR], ARRAY[]::ARRAY[INTERVAL HOUR], null::ARRAY[INTERVAL HOUR]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(days=+1, hours=+8), relativedelta(hours=-3), None])
+        self.assertEqual(res[0], [_RD(days=+1, hours=+8), _RD(hours=-3), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['00:04.0005', '03:04', null]::ARRAY[INTERVAL MINUTE TO SECOND], ARRAY[]::ARRAY[INTERVAL MINUTE TO SECOND], null::ARRAY[INTERVAL MINUTE TO SECOND]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(seconds=+4, microseconds=+500), relativedelta(minutes=+3, seconds=+4), None])
+        self.assertEqual(res[0], [_RD(seconds=+4, microseconds=+500), _RD(minutes=+3, seconds=+4), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['03', '-34', null]::ARRAY[INTERVAL MINUTE], ARRAY[]::ARRAY[INTERVAL MINUTE], null::ARRAY[INTERVAL MINUTE]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(minutes=+3), relativedelta(minutes=-34), None])
+        self.assertEqual(res[0], [_RD(minutes=+3), _RD(minutes=-34), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['216901.024', '216901', null]::ARRAY[INTERVAL SECOND], ARRAY[]::ARRAY[INTERVAL SECOND], null::ARRAY[INTERVAL SECOND]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(days=+2, hours=+12, minutes=+15, seconds=+1, microseconds=+24000),
-                                  relativedelta(days=+2, hours=+12, minutes=+15, seconds=+1), None])
+        self.assertEqual(res[0], [_RD(days=+2, hours=+12, minutes=+15, seconds=+1, microseconds=+24000),
+                                  _RD(days=+2, hours=+12, minutes=+15, seconds=+1), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
     def test_1DArray_intervalYM_type(self):
         query = "SELECT ARRAY['1y 10m', '1y', '10m ago', null]::ARRAY[INTERVAL YEAR TO MONTH], ARRAY[]::ARRAY[INTERVAL YEAR TO MONTH], null::ARRAY[INTERVAL YEAR TO MONTH]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(years=+1, months=+10), relativedelta(years=+1), relativedelta(months=-10), None])
+        self.assertEqual(res[0], [_RD(years=+1, months=+10), _RD(years=+1), _RD(months=-10), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['1y ago', '2y', null]::ARRAY[INTERVAL YEAR], ARRAY[]::ARRAY[INTERVAL YEAR], null::ARRAY[INTERVAL YEAR]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(years=-1), relativedelta(years=+2), None])
+        self.assertEqual(res[0], [_RD(years=-1), _RD(years=+2), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
         query = "SELECT ARRAY['1y 10m', '1y', '10m ago', null]::ARRAY[INTERVAL MONTH], ARRAY[]::ARRAY[INTERVAL MONTH], null::ARRAY[INTERVAL MONTH]"
         res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], [relativedelta(years=+1, months=+10), relativedelta(years=+1), relativedelta(months=-10), None])
+        self.assertEqual(res[0], [_RD(years=+1, months=+10), _RD(years=+1), _RD(months=-10), None])
         self.assertEqual(res[1], [])
         self.assertEqual(res[2], None)
 
@@ -520,235 +557,193 @@ class ComplexTypeTestCase(VerticaPythonIntegrationTestCase):
         self.assertEqual(res[0], [{"first_name":"Amy","id":2,"date":date(2021, 6, 10)},{"first_name":"Fred","id":4,"date":date(1998, 2, 24)}])
 
 
+    # Column expressions of the single-statement SET/ROW test queries, keyed
+    # by test case. They are fused into one SELECT and fetched in a single
+    # round trip on first use, instead of paying one round trip per case.
+    # Cases that need session state (e.g. SET TIMEZONE) are kept out of it.
+    _BATCH_QUERIES = {
+        '1DSet_boolean': ("SET['t', 'f', null]::SET[BOOL]", "SET[]::SET[BOOL]", "null::SET[BOOL]"),
+        '1DSet_integer': ("SET[0,1,-2,3,null]::SET[INT]", "SET[]::SET[INT]", "null::SET[INT]"),
+        '1DSet_float': ("SET['Infinity'::float, '-Infinity'::float, null, -1.234, 0, 1.23456e-18]::SET[FLOAT]",
+            "SET[]::SET[FLOAT]", "null::SET[FLOAT]"),
+        '1DSet_numeric': ("SET[-1.12, 0, null, 1234567890123456789.0123456789]::SET[NUMERIC]",
+            "SET[]::SET[DECIMAL]", "null::SET[NUMERIC]"),
+        '1DSet_char': (u"SET['a', '\u16b1b', null, 'foo']::SET[CHAR(3)]", "SET[]::SET[CHAR(4)]", "null::SET[CHAR(5)]"),
+        '1DSet_varchar': (u"SET['', '\u16b1\nb', null, 'foo']::SET[VARCHAR(10),4]", "SET[]::SET[VARCHAR(4)]", "null::SET[VARCHAR]"),
+        '1DSet_date': ("SET['2021-06-10', null, '0221-05-02']::SET[DATE]", "SET[]::SET[DATE]", "null::SET[DATE]"),
+        '1DSet_time': ("SET['00:00:00.00', null, '22:36:33.123956']::SET[TIME(3)]", "SET[]::SET[TIME(4)]", "null::SET[TIME]"),
+        '1DSet_timetz': ("SET['22:36:33.12345+0630', null, '800-02-03 22:36:33.123456 America/Cayman']::SET[TIMETZ(3)]",
+            "SET[]::SET[TIMETZ(4)]", "null::SET[TIMETZ]"),
+        '1DSet_timestamp': ("SET['276-12-1 11:22:33', '2001-12-01 00:30:45.087', null]::SET[TIMESTAMP]",
+            "SET[]::SET[TIMESTAMP(4)]", "null::SET[TIMESTAMP]"),
+        '1DSet_interval_day_to_second': ("SET['1 02:03:04.0005', '1 02:03:04', '02:03:04.0005', '02:03', null]::SET[INTERVAL DAY TO SECOND]",
+            "SET[]::SET[INTERVAL DAY TO SECOND]", "null::SET[INTERVAL DAY TO SECOND]"),
+        '1DSet_interval_day_to_minute': ("SET['1 02:03', '02:03', null]::SET[INTERVAL DAY TO MINUTE]",
+            "SET[]::SET[INTERVAL DAY TO MINUTE]", "null::SET[INTERVAL DAY TO MINUTE]"),
+        '1DSet_interval_day_to_hour': ("SET['1 02:03', '6', '02:03', null]::SET[INTERVAL DAY TO HOUR]",
+            "SET[]::SET[INTERVAL DAY TO HOUR]", "null::SET[INTERVAL DAY TO HOUR]"),
+        '1DSet_interval_day': ("SET['123', '-6', null]::SET[INTERVAL DAY]",
+            "SET[]::SET[INTERVAL DAY]", "null::SET[INTERVAL DAY]"),
+        '1DSet_interval_hour_to_second': ("SET['02:03:04', '02:03:04.0005', '02:03', null]::SET[INTERVAL HOUR TO SECOND]",
+            "SET[]::SET[INTERVAL HOUR TO SECOND]", "null::SET[INTERVAL HOUR TO SECOND]"),
+        '1DSet_interval_hour_to_minute': ("SET['02:03:04', '-02:03', null]::SET[INTERVAL HOUR TO MINUTE]",
+            "SET[]::SET[INTERVAL HOUR TO MINUTE]", "null::SET[INTERVAL HOUR TO MINUTE]"),
+        '1DSet_interval_hour': ("SET['32', '-03', null]::SET[INTERVAL HOUR]",
+            "SET[]::SET[INTERVAL HOUR]", "null::SET[INTERVAL HOUR]"),
+        '1DSet_interval_minute_to_second': ("SET['00:04.0005', '03:04', null]::SET[INTERVAL MINUTE TO SECOND]",
+            "SET[]::SET[INTERVAL MINUTE TO SECOND]", "null::SET[INTERVAL MINUTE TO SECOND]"),
+        '1DSet_interval_minute': ("SET['03', '-34', null]::SET[INTERVAL MINUTE]",
+            "SET[]::SET[INTERVAL MINUTE]", "null::SET[INTERVAL MINUTE]"),
+        '1DSet_interval_second': ("SET['216901.024', '216901', null]::SET[INTERVAL SECOND]",
+            "SET[]::SET[INTERVAL SECOND]", "null::SET[INTERVAL SECOND]"),
+        '1DSet_interval_year_to_month': ("SET['1y 10m', '1y', '10m ago', null]::SET[INTERVAL YEAR TO MONTH]",
+            "SET[]::SET[INTERVAL YEAR TO MONTH]", "null::SET[INTERVAL YEAR TO MONTH]"),
+        '1DSet_interval_year': ("SET['1y ago', '2y', null]::SET[INTERVAL YEAR]",
+            "SET[]::SET[INTERVAL YEAR]", "null::SET[INTERVAL YEAR]"),
+        '1DSet_interval_month': ("SET['1y 10m', '1y', '10m ago', null]::SET[INTERVAL MONTH]",
+            "SET[]::SET[INTERVAL MONTH]", "null::SET[INTERVAL MONTH]"),
+        '1DSet_UUID': ("SET['00010203-0405-0607-0809-0a0b0c0d0e0f', null]::SET[UUID]",
+            "SET[]::SET[UUID]", "null::SET[UUID]"),
+        '1DSet_binary': ("SET[hex_to_binary('0x41'), hex_to_binary('0x4243'), null]::SET[BINARY(2)]",
+            "SET[]::SET[BINARY(4)]", "null::SET[BINARY]"),
+        '1DSet_varbinary': ("SET[hex_to_binary('0x41'), hex_to_binary('0x4210'), null]::SET[VARBINARY(2)]",
+            "SET[]::SET[VARBINARY(4)]", "null::SET[VARBINARY]"),
+        'Set_dummy': ("SET[]",),
+        '1DRow': ("ROW(null, 'Amy', -3::int, '-Infinity'::float, 2.5::numeric, '2021-10-23'::DATE, false::bool, hex_to_binary('0x4210')::VARBINARY)",
+            "null::ROW(a VARCHAR)"),
+        'NDRow_nested_array': ("ROW('Amy',ARRAY[1.5,-2,3.75],ARRAY[ARRAY[false::bool,null,true::bool]])::ROW(name varchar, b ARRAY[NUMERIC], c ARRAY[ARRAY[BOOL]])",),
+        'NDRow_nested_row': ("ROW(ROW(ARRAY[ROW(ARRAY[1,2,3]),ROW(ARRAY[4,5,6]),ROW(ARRAY[7,8,9])]::ARRAY[ROW(d3 ARRAY[INTERVAL DAY])] AS d2) AS d1)",),
+        'Row_dummy': ("ROW()",),
+        'Row_dummy_nested': ("ROW(ROW())", "ROW(ARRAY[])"),
+    }
+
+
+    # Expected values of the batched SET cases above. They are built once
+    # as frozensets at class-creation time, so every test invocation (and
+    # the prep-stmt mirror class) compares against the same shared objects.
+    _SET_EXPECTED = {
+        '1DSet_boolean': frozenset({True, False, None}),
+        '1DSet_integer': frozenset({0, 1, -2, 3, None}),
+        '1DSet_float': frozenset({float('Inf'), float('-Inf'), None, -1.234, 0.0, 1.23456e-18}),
+        '1DSet_numeric': frozenset({Decimal('-1.1200000000'), Decimal('0E-10'), None, Decimal('1234567890123456789.0123456789')}),
+        '1DSet_char': frozenset({'a  ', u'\u16b1', None, 'foo'}),
+        '1DSet_varchar': frozenset({'', u'\u16b1\nb', None, 'foo'}),
+        '1DSet_date': frozenset({date(2021, 6, 10), None, date(221, 5, 2)}),
+        '1DSet_time': frozenset({time(0, 0, 0), None, time(22, 36, 33, 124000)}),
+        '1DSet_timetz': frozenset({time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)), None,
+                                      time(22, 36, 33, 123000, tzinfo=tzoffset(None, -19176))}),
+        '1DSet_timestamp': frozenset({datetime(276, 12, 1, 11, 22, 33), datetime(2001, 12, 1, 0, 30, 45, 87000), None}),
+        '1DSet_interval_day_to_second': frozenset({_RD(days=+1, hours=+2, minutes=+3, seconds=+4, microseconds=+500),
+                    _RD(days=+1, hours=+2, minutes=+3, seconds=+4),
+                    _RD(hours=+2, minutes=+3, seconds=+4, microseconds=+500),
+                    _RD(hours=+2, minutes=+3), None}),
+        '1DSet_interval_day_to_minute': frozenset({_RD(days=+1, hours=+2, minutes=+3), _RD(hours=+2, minutes=+3), None}),
+        '1DSet_interval_day_to_hour': frozenset({_RD(days=+1, hours=+2), _RD(days=+6), _RD(hours=+2), None}),
+        '1DSet_interval_day': frozenset({_RD(days=+123), _RD(days=-6), None}),
+        '1DSet_interval_hour_to_second': frozenset({_RD(hours=+2, minutes=+3, seconds=+4),
+                    _RD(hours=+2, minutes=+3, seconds=+4, microseconds=+500),
+                    _RD(hours=+2, minutes=+3), None}),
+        '1DSet_interval_hour_to_minute': frozenset({_RD(hours=+2, minutes=+3), _RD(hours=-2, minutes=-3), None}),
+        '1DSet_interval_hour': frozenset({_RD(days=+1, hours=+8), _RD(hours=-3), None}),
+        '1DSet_interval_minute_to_second': frozenset({_RD(seconds=+4, microseconds=+500), _RD(minutes=+3, seconds=+4), None}),
+        '1DSet_interval_minute': frozenset({_RD(minutes=+3), _RD(minutes=-34), None}),
+        '1DSet_interval_second': frozenset({_RD(days=+2, hours=+12, minutes=+15, seconds=+1, microseconds=+24000),
+                                      _RD(days=+2, hours=+12, minutes=+15, seconds=+1), None}),
+        '1DSet_interval_year_to_month': frozenset({_RD(years=+1, months=+10), _RD(years=+1), _RD(months=-10), None}),
+        '1DSet_interval_year': frozenset({_RD(years=-1), _RD(years=+2), None}),
+        '1DSet_interval_month': frozenset({_RD(years=+1, months=+10), _RD(years=+1), _RD(months=-10), None}),
+        '1DSet_UUID': frozenset({UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'), None}),
+        '1DSet_binary': frozenset({b'A\x00', b'BC', None}),
+        '1DSet_varbinary': frozenset({b'A', b'B\x10', None}),
+    }
+
+    @classmethod
+    def _batched_fetchone(cls, key):
+        """Returns the result columns of one batched test case, running the
+        fused SELECT of all batched cases on the first call.
+
+        :param key: key into cls._BATCH_QUERIES
+        :return: the columns of the test case, as a slice of the fetched row
+        """
+        if '_batch_row' not in cls.__dict__:
+            exprs = []
+            slices = {}
+            for name, columns in cls._BATCH_QUERIES.items():
+                slices[name] = slice(len(exprs), len(exprs) + len(columns))
+                exprs.extend(columns)
+            cur = cls._shared_cursor()
+            cur.execute("SELECT " + ", ".join(exprs))
+            cls._batch_row = cur.fetchone()
+            cls._batch_slices = slices
+        return cls._batch_row[cls._batch_slices[key]]
+
     #####################
     # tests for SET type
     #####################
-    def test_1DSet_boolean_type(self):
-        query = "SELECT SET['t', 'f', null]::SET[BOOL], SET[]::SET[BOOL], null::SET[BOOL]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {True, False, None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_integer_type(self):
-        query = "SELECT SET[0,1,-2,3,null]::SET[INT], SET[]::SET[INT], null::SET[INT]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {0, 1, -2, 3, None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_float_type(self):
-        query = ("SELECT SET['Infinity'::float, '-Infinity'::float, null, -1.234, 0, 1.23456e-18]::SET[FLOAT],"
-                 " SET[]::SET[FLOAT], null::SET[FLOAT]")
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {float('Inf'), float('-Inf'), None, -1.234, 0.0, 1.23456e-18})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_numeric_type(self):
-        query = "SELECT SET[-1.12, 0, null, 1234567890123456789.0123456789]::SET[NUMERIC], SET[]::SET[DECIMAL], null::SET[NUMERIC]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {Decimal('-1.1200000000'), Decimal('0E-10'), None, Decimal('1234567890123456789.0123456789')})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_char_type(self):
-        query = u"SELECT SET['a', '\u16b1b', null, 'foo']::SET[CHAR(3)], SET[]::SET[CHAR(4)], null::SET[CHAR(5)]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {'a  ', u'\u16b1', None, 'foo'})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_varchar_type(self):
-        query = u"SELECT SET['', '\u16b1\nb', null, 'foo']::SET[VARCHAR(10),4], SET[]::SET[VARCHAR(4)], null::SET[VARCHAR]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {'', u'\u16b1\nb', None, 'foo'})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_date_type(self):
-        query = "SELECT SET['2021-06-10', null, '0221-05-02']::SET[DATE], SET[]::SET[DATE], null::SET[DATE]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {date(2021, 6, 10), None, date(221, 5, 2)})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_time_type(self):
-        query = "SELECT SET['00:00:00.00', null, '22:36:33.123956']::SET[TIME(3)], SET[]::SET[TIME(4)], null::SET[TIME]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {time(0, 0, 0), None, time(22, 36, 33, 124000)})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_timetz_type(self):
-        query = "SELECT SET['22:36:33.12345+0630', null, '800-02-03 22:36:33.123456 America/Cayman']::SET[TIMETZ(3)], SET[]::SET[TIMETZ(4)], null::SET[TIMETZ]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {time(22, 36, 33, 123000, tzinfo=tzoffset(None, 23400)), None, 
-                                  time(22, 36, 33, 123000, tzinfo=tzoffset(None, -19176))})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_timestamp_type(self):
-        query = "SELECT SET['276-12-1 11:22:33', '2001-12-01 00:30:45.087', null]::SET[TIMESTAMP], SET[]::SET[TIMESTAMP(4)], null::SET[TIMESTAMP]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {datetime(276, 12, 1, 11, 22, 33), datetime(2001, 12, 1, 0, 30, 45, 87000), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
+    def test_1DSet_types(self):
+        # All batched SET cases share the same shape: the populated set,
+        # an empty set and a NULL. One subTest per case keeps the
+        # failures individually reported.
+        for key, expected in self._SET_EXPECTED.items():
+            with self.subTest(case=key):
+                res = self._batched_fetchone(key)
+                self.assertEqual(res[0], expected)
+                self.assertEqual(res[1], set())
+                self.assertEqual(res[2], None)
 
     def test_1DSet_timestamptz_type(self):
         with self._connect() as conn:
             cur = conn.cursor()
-            cur.execute("SET TIMEZONE 'America/Cayman'") # set session's time zone
-            cur.fetchall()
-            query = "SELECT SET['276-12-1 11:22:33+0630', '2001-12-01 00:30:45.087 America/Cayman', null]::SET[TIMESTAMPTZ], SET[]::SET[TIMESTAMPTZ(4)], null::SET[TIMESTAMPTZ]"
-            cur.execute(query)
+            # Set the session's time zone and run the query in one round trip
+            query = "SET TIMEZONE 'America/Cayman'; SELECT SET['276-12-1 11:22:33+0630', '2001-12-01 00:30:45.087 America/Cayman', null]::SET[TIMESTAMPTZ], SET[]::SET[TIMESTAMPTZ(4)], null::SET[TIMESTAMPTZ]"
+            # A prepared statement cannot hold multiple commands, so force
+            # the simple-query protocol for this compound statement
+            cur.execute(query, use_prepared_statements=False)
+            self.assertTrue(cur.nextset())  # advance past SET TIMEZONE
             res = cur.fetchone()
             self.assertEqual(res[0], {datetime(276, 11, 30, 23, 32, 57, tzinfo=tzoffset(None, -19176)),
                                 datetime(2001, 12, 1, 0, 30, 45, 87000, tzinfo=tzoffset(None, -18000)), None})
             self.assertEqual(res[1], set())
             self.assertEqual(res[2], None)
 
-    def test_1DSet_interval_type(self):
-        query = "SELECT SET['1 02:03:04.0005', '1 02:03:04', '02:03:04.0005', '02:03', null]::SET[INTERVAL DAY TO SECOND], SET[]::SET[INTERVAL DAY TO SECOND], null::SET[INTERVAL DAY TO SECOND]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(days=+1, hours=+2, minutes=+3, seconds=+4, microseconds=+500),
-                relativedelta(days=+1, hours=+2, minutes=+3, seconds=+4),
-                relativedelta(hours=+2, minutes=+3, seconds=+4, microseconds=+500),
-                relativedelta(hours=+2, minutes=+3), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['1 02:03', '02:03', null]::SET[INTERVAL DAY TO MINUTE], SET[]::SET[INTERVAL DAY TO MINUTE], null::SET[INTERVAL DAY TO MINUTE]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(days=+1, hours=+2, minutes=+3), relativedelta(hours=+2, minutes=+3), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['1 02:03', '6', '02:03', null]::SET[INTERVAL DAY TO HOUR], SET[]::SET[INTERVAL DAY TO HOUR], null::SET[INTERVAL DAY TO HOUR]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(days=+1, hours=+2), relativedelta(days=+6), relativedelta(hours=+2), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['123', '-6', null]::SET[INTERVAL DAY], SET[]::SET[INTERVAL DAY], null::SET[INTERVAL DAY]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(days=+123), relativedelta(days=-6), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['02:03:04', '02:03:04.0005', '02:03', null]::SET[INTERVAL HOUR TO SECOND], SET[]::SET[INTERVAL HOUR TO SECOND], null::SET[INTERVAL HOUR TO SECOND]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(hours=+2, minutes=+3, seconds=+4),
-                relativedelta(hours=+2, minutes=+3, seconds=+4, microseconds=+500),
-                relativedelta(hours=+2, minutes=+3), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['02:03:04', '-02:03', null]::SET[INTERVAL HOUR TO MINUTE], SET[]::SET[INTERVAL HOUR TO MINUTE], null::SET[INTERVAL HOUR TO MINUTE]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(hours=+2, minutes=+3), relativedelta(hours=-2, minutes=-3), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['32', '-03', null]::SET[INTERVAL HOUR], SET[]::SET[INTERVAL HOUR], null::SET[INTERVAL HOUR]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(days=+1, hours=+8), relativedelta(hours=-3), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['00:04.0005', '03:04', null]::SET[INTERVAL MINUTE TO SECOND], SET[]::SET[INTERVAL MINUTE TO SECOND], null::SET[INTERVAL MINUTE TO SECOND]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(seconds=+4, microseconds=+500), relativedelta(minutes=+3, seconds=+4), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['03', '-34', null]::SET[INTERVAL MINUTE], SET[]::SET[INTERVAL MINUTE], null::SET[INTERVAL MINUTE]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(minutes=+3), relativedelta(minutes=-34), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['216901.024', '216901', null]::SET[INTERVAL SECOND], SET[]::SET[INTERVAL SECOND], null::SET[INTERVAL SECOND]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(days=+2, hours=+12, minutes=+15, seconds=+1, microseconds=+24000),
-                                  relativedelta(days=+2, hours=+12, minutes=+15, seconds=+1), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_intervalYM_type(self):
-        query = "SELECT SET['1y 10m', '1y', '10m ago', null]::SET[INTERVAL YEAR TO MONTH], SET[]::SET[INTERVAL YEAR TO MONTH], null::SET[INTERVAL YEAR TO MONTH]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(years=+1, months=+10), relativedelta(years=+1), relativedelta(months=-10), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['1y ago', '2y', null]::SET[INTERVAL YEAR], SET[]::SET[INTERVAL YEAR], null::SET[INTERVAL YEAR]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(years=-1), relativedelta(years=+2), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-        query = "SELECT SET['1y 10m', '1y', '10m ago', null]::SET[INTERVAL MONTH], SET[]::SET[INTERVAL MONTH], null::SET[INTERVAL MONTH]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {relativedelta(years=+1, months=+10), relativedelta(years=+1), relativedelta(months=-10), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_UUID_type(self):
-        query = "SELECT SET['00010203-0405-0607-0809-0a0b0c0d0e0f', null]::SET[UUID], SET[]::SET[UUID], null::SET[UUID]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {UUID('00010203-0405-0607-0809-0a0b0c0d0e0f'), None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_binary_type(self):
-        query = "SELECT SET[hex_to_binary('0x41'), hex_to_binary('0x4243'), null]::SET[BINARY(2)], SET[]::SET[BINARY(4)], null::SET[BINARY]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {b'A\x00', b'BC', None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
-    def test_1DSet_varbinary_type(self):
-        query = "SELECT SET[hex_to_binary('0x41'), hex_to_binary('0x4210'), null]::SET[VARBINARY(2)], SET[]::SET[VARBINARY(4)], null::SET[VARBINARY]"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {b'A', b'B\x10', None})
-        self.assertEqual(res[1], set())
-        self.assertEqual(res[2], None)
-
     def test_Set_dummy_type(self):
-        query = "SELECT SET[]"
-        res = self._query_and_fetchone(query)
+        res = self._batched_fetchone('Set_dummy')
         self.assertEqual(res[0], set())
 
     #####################
     # tests for ROW type
     #####################
+    # Expected values of the batched ROW cases, built once at class-creation
+    # time like _SET_EXPECTED above. They stay plain dicts compared with
+    # assertEqual: dict equality is order-insensitive and gives a readable
+    # diff on failure, unlike comparing serialized byte strings.
+    _ROW_EXPECTED = {
+        '1DRow': {"f0":None,"f1":"Amy","f2":-3,"f3":float('-Inf'),"f4":Decimal('2.5'),"f5":date(2021, 10, 23),"f6":False, "f7":b'B\x10'},
+        'NDRow_nested_array': {"name":"Amy","b":[Decimal('1.5'),Decimal('-2'),Decimal('3.75')],"c":[[False,None,True]]},
+        'NDRow_nested_row': {"d1":{"d2":[
+            {"d3":[_RD(days=+1),_RD(days=+2),_RD(days=+3)]},
+            {"d3":[_RD(days=+4),_RD(days=+5),_RD(days=+6)]},
+            {"d3":[_RD(days=+7),_RD(days=+8),_RD(days=+9)]}]}},
+    }
+
     def test_1DRow_type(self):
-        query = "SELECT ROW(null, 'Amy', -3::int, '-Infinity'::float, 2.5::numeric, '2021-10-23'::DATE, false::bool, hex_to_binary('0x4210')::VARBINARY), null::ROW(a VARCHAR)"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {"f0":None,"f1":"Amy","f2":-3,"f3":float('-Inf'),"f4":Decimal('2.5'),"f5":date(2021, 10, 23),"f6":False, "f7":b'B\x10'})
+        res = self._batched_fetchone('1DRow')
+        self.assertEqual(res[0], self._ROW_EXPECTED['1DRow'])
         self.assertEqual(res[1], None)
 
     def test_NDRow_type(self):
-        query = "SELECT ROW('Amy',ARRAY[1.5,-2,3.75],ARRAY[ARRAY[false::bool,null,true::bool]])::ROW(name varchar, b ARRAY[NUMERIC], c ARRAY[ARRAY[BOOL]])"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {"name":"Amy","b":[Decimal('1.5'),Decimal('-2'),Decimal('3.75')],"c":[[False,None,True]]})
+        res = self._batched_fetchone('NDRow_nested_array')
+        self.assertEqual(res[0], self._ROW_EXPECTED['NDRow_nested_array'])
 
-        query = "SELECT ROW(ROW(ARRAY[ROW(ARRAY[1,2,3]),ROW(ARRAY[4,5,6]),ROW(ARRAY[7,8,9])]::ARRAY[ROW(d3 ARRAY[INTERVAL DAY])] AS d2) AS d1)"
-        res = self._query_and_fetchone(query)
-        self.assertEqual(res[0], {"d1":{"d2":[
-            {"d3":[relativedelta(days=+1),relativedelta(days=+2),relativedelta(days=+3)]},
-            {"d3":[relativedelta(days=+4),relativedelta(days=+5),relativedelta(days=+6)]},
-            {"d3":[relativedelta(days=+7),relativedelta(days=+8),relativedelta(days=+9)]}]}})
+        res = self._batched_fetchone('NDRow_nested_row')
+        self.assertEqual(res[0], self._ROW_EXPECTED['NDRow_nested_row'])
 
     def test_Row_dummy_type(self):
-        query = "SELECT ROW()"
-        res = self._query_and_fetchone(query)
+        res = self._batched_fetchone('Row_dummy')
         self.assertEqual(res[0], {})
 
-        query = "SELECT ROW(ROW()), ROW(ARRAY[])"
-        res = self._query_and_fetchone(query)
+        res = self._batched_fetchone('Row_dummy_nested')
         self.assertEqual(res[0], {"f0":{}})
         self.assertEqual(res[1], {"f0":[]})
 
-exec(ComplexTypeTestCase.createPrepStmtClass())
+PrepStmtComplexTypeTestCase = ComplexTypeTestCase.createPrepStmtClass()
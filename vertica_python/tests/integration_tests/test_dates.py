@@ -153,4 +153,4 @@ class DateParsingTestCase(VerticaPythonIntegrationTestCase):
         self._test_not_supported(test_cases=test_cases, msg='BC indicator -> BC indicator')
 
 
-exec(DateParsingTestCase.createPrepStmtClass())
+PrepStmtDateParsingTestCase = DateParsingTestCase.createPrepStmtClass()
@@ -64,4 +64,4 @@ class ErrorTestCase(VerticaPythonIntegrationTestCase):
             cur.execute("DROP TABLE IF EXISTS duplicate_table")
 
 
-exec(ErrorTestCase.createPrepStmtClass())
+PrepStmtErrorTestCase = ErrorTestCase.createPrepStmtClass()
@@ -287,4 +287,4 @@ class LoadBalanceTestCase(VerticaPythonIntegrationTestCase):
                 self.assertEqual(i, [True])
 
 
-exec(LoadBalanceTestCase.createPrepStmtClass())
+PrepStmtLoadBalanceTestCase = LoadBalanceTestCase.createPrepStmtClass()
@@ -87,4 +87,4 @@ class TimeZoneTestCase(VerticaPythonIntegrationTestCase):
         self._test_ts(test_cases=test_cases)
 
 
-exec(TimeZoneTestCase.createPrepStmtClass())
+PrepStmtTimeZoneTestCase = TimeZoneTestCase.createPrepStmtClass()
@@ -108,9 +108,13 @@ class DataTransferFormatTestCase(VerticaPythonIntegrationTestCase):
 
     def test_set_type(self):
         self._test_equal_value("SET[INT]", ["SET[1,2,3]"])
+        # The server serializes collections as JSON text even under binary
+        # transfer, so string sets take the same parse path in both modes
+        self._test_equal_value("SET[CHAR(3)]", [u"SET['a','\u16b1b','c']"])
+        self._test_equal_value("SET[VARCHAR]", [u"SET['foo','\u16b1 bar','']"])
 
     def test_row_type(self):
         self._test_equal_value("ROW(name varchar, age int, c ARRAY[INT])", ["ROW('Amy',25,ARRAY[1,2,3])"])
 
 
-exec(DataTransferFormatTestCase.createPrepStmtClass())
+PrepStmtDataTransferFormatTestCase = DataTransferFormatTestCase.createPrepStmtClass()
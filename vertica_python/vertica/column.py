@@ -71,6 +71,7 @@ class Column(object):
         self.is_identity = col['is_identity']
         self.format_code = col['format_code']
         self.child_columns = None
+        self._field_names = None
         self.props = ColumnTuple(self.name, self.type_code, self.display_size, self.internal_size,
                                  self.precision, self.scale, self.null_ok)
 
@@ -82,6 +83,14 @@ class Column(object):
         if self.child_columns is None:
             self.child_columns = []
         self.child_columns.append(col)
+        self._field_names = None
+
+    def get_field_names(self):
+        """Returns the names of the child columns as a tuple, built on first
+        use and cached for the deserializer's per-row work."""
+        if self._field_names is None:
+            self._field_names = tuple(col.name for col in self.child_columns)
+        return self._field_names
 
     def debug_info(self):
         childs = ""
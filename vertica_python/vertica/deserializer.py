@@ -49,7 +49,6 @@ class Deserializer(object):
         return deserializer
 
 
-YEAR_TO_MONTH_RE = re.compile(r"(-)?(\d+)-(\d+)")
 TIMETZ_RE = re.compile(
     r"""(?ix)
     ^
@@ -123,6 +122,12 @@ def load_date_text(val, ctx):
     s = as_str(val)
     if s.endswith(' BC'):
         raise errors.NotSupportedError('Dates Before Christ are not supported by datetime.date. Got: {0}'.format(s))
+    try:
+        # Fast path: the common case is a fixed-width ISO 8601 date, which the
+        # C-implemented fromisoformat() parses an order of magnitude faster
+        return date.fromisoformat(s)
+    except ValueError:
+        pass
     try:
         return date(*map(lambda x: int(x), s.split('-')))
     except ValueError:
@@ -154,6 +159,11 @@ def load_time_text(val, ctx):
     :return: datetime.time
     """
     val = as_str(val)
+    try:
+        # Fast path: HH:MM:SS[.ffffff] is valid ISO 8601
+        return time.fromisoformat(val)
+    except ValueError:
+        pass
     if len(val) == 8:
         return datetime.strptime(val, '%H:%M:%S').time()
     return datetime.strptime(val, '%H:%M:%S.%f').time()
@@ -240,9 +250,25 @@ def load_timestamp_text(val, ctx):
     s = as_str(val)
     if s.endswith(" BC"):
         raise errors.NotSupportedError('Timestamps Before Christ are not supported by datetime.datetime. Got: {0}'.format(s))
-    fmt = '%Y-%m-%d %H:%M:%S.%f' if '.' in s else '%Y-%m-%d %H:%M:%S'
     try:
-        return datetime.strptime(s, fmt)
+        # Fast path: fixed-width timestamps are valid ISO 8601, which the
+        # C-implemented fromisoformat() parses an order of magnitude faster.
+        # Years before 1000 come without zero-padding and take the slow path.
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
+    # Slow path: scan the fields directly instead of going through strptime's
+    # format machinery, e.g. for fraction widths fromisoformat() rejects
+    try:
+        d, _, t = s.partition(' ')
+        year, month, day = map(lambda x: int(x), d.split('-'))
+        fraction = 0
+        dot = t.find('.')
+        if dot >= 0:
+            fraction = int(t[dot+1:]) * 10**(6 - len(t) + dot + 1)
+            t = t[:dot]
+        hour, minute, second = map(lambda x: int(x), t.split(':'))
+        return datetime(year, month, day, hour, minute, second, fraction)
     except ValueError:
         raise errors.NotSupportedError('Timestamps after year 9999 are not supported by datetime.datetime. Got: {0}'.format(s))
 
@@ -356,6 +382,11 @@ def load_interval_text(val, ctx):
             parts[parts_idx] = sign * int(val)
             parts_idx += 1
 
+    # Note: datetime.timedelta would be cheaper to build and compare, but
+    # relativedelta is the documented return type for all INTERVAL columns
+    # (see the type mapping table in README.md) and year/month intervals
+    # cannot be expressed as a timedelta, so changing it here would break
+    # consumers and split the interval API in two.
     return relativedelta(days=parts[0], hours=parts[1], minutes=parts[2], seconds=parts[3], microseconds=parts[4])
 
 def load_interval_binary(val, ctx):
@@ -379,11 +410,12 @@ def load_intervalYM_text(val, ctx):
     s = as_str(val)
     type_name = ctx['column'].type_name
     if type_name == 'Interval Year to Month':
-        m = YEAR_TO_MONTH_RE.match(s)
-        if not m:
+        # [-]yy-mm, scanned at fixed positions instead of through a regex
+        negative = s.startswith('-')
+        year, _, month = (s[1:] if negative else s).partition('-')
+        if not (year.isdigit() and month.isdigit()):
             raise errors.DataError("Cannot parse interval '{}'".format(s))
-        sign, year, month = m.groups()
-        sign = -1 if sign else 1
+        sign = -1 if negative else 1
         return relativedelta(years=sign*int(year), months=sign*int(month))
     else:
         try:
@@ -406,6 +438,24 @@ def load_intervalYM_binary(val, ctx):
     months = load_int8_binary(val, ctx)
     return relativedelta(months=months)
 
+def load_uuid_text(val, ctx):
+    """
+    Parses text representation of a UUID type.
+    :param val: bytes
+    :param ctx: dict
+    :return: uuid.UUID
+    """
+    s = as_str(val)
+    # Fast path: the server sends the canonical 8-4-4-4-12 form, whose hex
+    # digits can be pulled out at fixed offsets and handed to UUID(int=...),
+    # skipping the string normalization done by UUID(hex=...)
+    if len(s) == 36 and s[8] == s[13] == s[18] == s[23] == '-':
+        try:
+            return UUID(int=int(s[0:8] + s[9:13] + s[14:18] + s[19:23] + s[24:], 16))
+        except ValueError:
+            pass
+    return UUID(s)
+
 def load_uuid_binary(val, ctx):
     """
     Parses binary representation of a UUID type.
@@ -447,6 +497,11 @@ def load_array_text(val, ctx):
     :param ctx: dict
     :return: list
     """
+    # Fast path: an empty array arrives as b'[]'. The result must be a
+    # fresh list -- not a shared constant -- because callers may mutate
+    # what they fetch.
+    if val == b'[]' and ctx['complex_types_enabled']:
+        return []
     val = val.decode('utf-8', ctx['unicode_error'])
     # Some old servers have a bug of sending ARRAY oid without child metadata
     if not ctx['complex_types_enabled']:
@@ -461,6 +516,11 @@ def load_set_text(val, ctx):
     :param ctx: dict
     :return: set
     """
+    # Fast path: an empty set arrives as b'[]', no need to run the JSON
+    # parser to find that out. A fresh set is returned each time because
+    # the caller is free to mutate it.
+    if val == b'[]' and ctx['complex_types_enabled']:
+        return set()
     return set(load_array_text(val, ctx))
 
 def parse_array(json_data, ctx):
@@ -500,49 +560,32 @@ def parse_row(json_data, ctx):
     if not isinstance(json_data, dict):
         raise TypeError('Expected a dict, got {}'.format(json_data))
     # A row has one or more child fields
-    child_columns = ctx['column'].child_columns
+    row_column = ctx['column']
+    child_columns = row_column.child_columns
     if child_columns is None:   # Special case: SELECT ROW();
         return json_data
     if len(json_data) != len(child_columns): # This situation should never occur
         raise ValueError('The metadata does not match the fields in the ROW.')
-    parsed_row = {}
-    for child_column in child_columns:
-        key = child_column.name
-        element = json_data[key]
+    keys = row_column.get_field_names()
+    vals = [None] * len(child_columns)
+    for idx, child_column in enumerate(child_columns):
+        element = json_data[keys[idx]]
         if element is None:
-            parsed_row[key] = None
             continue
         child_ctx = ctx.copy()
         child_ctx['column'] = child_column
-        parsed_row[key] = parse_json_element(element, child_ctx)
-    return parsed_row
+        vals[idx] = parse_json_element(element, child_ctx)
+    # Build the result dict in one call with its size known up front,
+    # instead of growing it one field at a time
+    return dict(zip(keys, vals))
 
 def parse_json_element(element, ctx):
-    type_code = ctx['column'].type_code
-    if type_code in (VerticaType.BOOL, VerticaType.INT8,
-                     VerticaType.CHAR, VerticaType.VARCHAR, VerticaType.LONGVARCHAR):
+    converter = JSON_ELEMENT_CONVERTERS.get(ctx['column'].type_code)
+    if converter is None:
+        # BOOL / INT8 / CHAR / VARCHAR / LONGVARCHAR elements (and any
+        # unrecognized type) are returned as parsed by the JSON decoder
         return element
-    # "-Infinity", "Infinity", "NaN"
-    if type_code == VerticaType.FLOAT8:
-        return float(element)
-    # element type: str
-    if type_code in (VerticaType.DATE, VerticaType.TIME, VerticaType.TIMETZ,
-                     VerticaType.TIMESTAMP, VerticaType.TIMESTAMPTZ,
-                     VerticaType.INTERVAL, VerticaType.INTERVALYM,
-                     VerticaType.BINARY, VerticaType.VARBINARY,
-                     VerticaType.LONGVARBINARY):
-        return DEFAULTS[FormatCode.TEXT][type_code](element, ctx)
-    elif type_code == VerticaType.NUMERIC:
-        return Decimal(element)
-    elif type_code == VerticaType.UUID:
-        return UUID(element)
-    # element type: list
-    elif type_code == VerticaType.ARRAY:
-        return parse_array(element, ctx)
-    # element type: dict
-    elif type_code == VerticaType.ROW:
-        return parse_row(element, ctx)
-    return element
+    return converter(element, ctx)
 
 DEFAULTS = {
     FormatCode.TEXT: {
@@ -561,7 +604,7 @@ DEFAULTS = {
         VerticaType.TIMESTAMPTZ: load_timestamptz_text,
         VerticaType.INTERVAL: load_interval_text,
         VerticaType.INTERVALYM: load_intervalYM_text,
-        VerticaType.UUID: lambda val, ctx: UUID(val.decode('utf-8')),
+        VerticaType.UUID: load_uuid_text,
         VerticaType.BINARY: load_varbinary_text,
         VerticaType.VARBINARY: load_varbinary_text,
         VerticaType.LONGVARBINARY: load_varbinary_text,
@@ -667,3 +710,25 @@ DEFAULTS = {
     },
 }
 
+# Dispatch table of parse_json_element(): selecting the converter of an
+# ARRAY/SET/ROW element is one dict lookup instead of a chain of type code
+# comparisons. Types absent from this table pass through unconverted.
+JSON_ELEMENT_CONVERTERS = {
+    # "-Infinity", "Infinity", "NaN"
+    VerticaType.FLOAT8: lambda element, ctx: float(element),
+    VerticaType.NUMERIC: lambda element, ctx: Decimal(element),
+    VerticaType.UUID: load_uuid_text,
+    # element type: list
+    VerticaType.ARRAY: parse_array,
+    # element type: dict
+    VerticaType.ROW: parse_row,
+}
+# element type: str
+for _type_code in (VerticaType.DATE, VerticaType.TIME, VerticaType.TIMETZ,
+                   VerticaType.TIMESTAMP, VerticaType.TIMESTAMPTZ,
+                   VerticaType.INTERVAL, VerticaType.INTERVALYM,
+                   VerticaType.BINARY, VerticaType.VARBINARY,
+                   VerticaType.LONGVARBINARY):
+    JSON_ELEMENT_CONVERTERS[_type_code] = DEFAULTS[FormatCode.TEXT][_type_code]
+del _type_code
+